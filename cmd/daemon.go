@@ -1,10 +1,12 @@
 package cmd
 
 import (
+	"context"
 	"fmt"
 	"log"
 	"os"
 	"os/signal"
+	"sync"
 	"syscall"
 	"time"
 
@@ -28,7 +30,7 @@ func init() {
 	RootCmd.AddCommand(startDaemonCmd)
 }
 
-func handleJobEvent(event monitor.JobEvent, logger *log.Logger, store config.ConfigStore, activeJobs map[string]chan struct{}, notifier notify.Notifier) {
+func handleJobEvent(event monitor.JobEvent, logger *log.Logger, store config.ConfigStore, activeJobs map[string]context.CancelFunc, notifier notify.Notifier) {
 	switch event.Kind {
 	case monitor.EventStatusChecked, monitor.EventError:
 		updateJobCheckStatus(event.JobURL, event.Failed, logger, store)
@@ -81,11 +83,8 @@ func handleJobEvent(event monitor.JobEvent, logger *log.Logger, store config.Con
 
 func updateJobCheckStatus(jobURL string, failed bool, logger *log.Logger, store config.ConfigStore) {
 	err := store.Update(func(cfg *config.Config) error {
-		if job, exists := cfg.Jobs[jobURL]; exists {
-			if job.LastCheckFailed != failed {
-				job.LastCheckFailed = failed
-				cfg.Jobs[jobURL] = job
-			}
+		if !cfg.UpdateJobCheckStatus(jobURL, failed) {
+			return config.ErrUnchanged
 		}
 		return nil
 	})
@@ -94,7 +93,15 @@ func updateJobCheckStatus(jobURL string, failed bool, logger *log.Logger, store
 	}
 }
 
-func finishJob(jobURL string, result string, logger *log.Logger, store config.ConfigStore, activeJobs map[string]chan struct{}) {
+// stopMonitor cancels a job's monitor goroutine and drops it from the active set.
+func stopMonitor(jobURL string, activeJobs map[string]context.CancelFunc) {
+	if cancel, exists := activeJobs[jobURL]; exists {
+		delete(activeJobs, jobURL)
+		cancel()
+	}
+}
+
+func finishJob(jobURL string, result string, logger *log.Logger, store config.ConfigStore, activeJobs map[string]context.CancelFunc) {
 	err := store.Update(func(cfg *config.Config) error {
 		cfg.FinishJob(jobURL, result)
 		return nil
@@ -103,13 +110,10 @@ func finishJob(jobURL string, result string, logger *log.Logger, store config.Co
 		logger.Printf("Error finishing job in config: %v", err)
 	}
 
-	if stopChan, exists := activeJobs[jobURL]; exists {
-		delete(activeJobs, jobURL)
-		close(stopChan)
-	}
+	stopMonitor(jobURL, activeJobs)
 }
 
-func removeJob(jobURL string, logger *log.Logger, store config.ConfigStore, activeJobs map[string]chan struct{}) {
+func removeJob(jobURL string, logger *log.Logger, store config.ConfigStore, activeJobs map[string]context.CancelFunc) {
 	err := store.Update(func(cfg *config.Config) error {
 		delete(cfg.Jobs, jobURL)
 		return nil
@@ -118,10 +122,7 @@ func removeJob(jobURL string, logger *log.Logger, store config.ConfigStore, acti
 		logger.Printf("Error removing finished job from config: %v", err)
 	}
 
-	if stopChan, exists := activeJobs[jobURL]; exists {
-		delete(activeJobs, jobURL)
-		close(stopChan)
-	}
+	stopMonitor(jobURL, activeJobs)
 }
 
 type DaemonDeps struct {
@@ -135,7 +136,7 @@ type DaemonDeps struct {
 	OnTick         func()
 }
 
-func reloadConfigAndJobs(deps DaemonDeps, logger *log.Logger, activeJobs map[string]chan struct{}, events chan<- monitor.JobEvent) {
+func reloadConfigAndJobs(ctx context.Context, deps DaemonDeps, logger *log.Logger, activeJobs map[string]context.CancelFunc, events chan<- monitor.JobEvent, wg *sync.WaitGroup) {
 	reloadedCfg, err := deps.Store.Load()
 	if err != nil {
 		logger.Printf("Error reloading config: %v", err)
@@ -144,35 +145,71 @@ func reloadConfigAndJobs(deps DaemonDeps, logger *log.Logger, activeJobs map[str
 
 	currentConfigJobs := reloadedCfg.GetJobs()
 
-	for jobURL, stopChan := range activeJobs {
+	for jobURL := range activeJobs {
 		if _, exists := currentConfigJobs[jobURL]; !exists {
 			logger.Printf("Stopping monitoring for removed job: %s", jobURL)
-			delete(activeJobs, jobURL)
-			close(stopChan)
+			stopMonitor(jobURL, activeJobs)
 		}
 	}
 
 	for jobURL := range currentConfigJobs {
 		if _, running := activeJobs[jobURL]; !running {
 			logger.Printf("Starting to monitor new job: %s", jobURL)
-			stopChan := make(chan struct{})
-			activeJobs[jobURL] = stopChan
-			go monitor.MonitorJob(jobURL, deps.Token, logger, events, deps.PollInterval, stopChan)
+			jobCtx, cancel := context.WithCancel(ctx)
+			activeJobs[jobURL] = cancel
+			wg.Add(1)
+			go func() {
+				defer wg.Done()
+				monitor.MonitorJob(jobCtx, jobURL, deps.Token, logger, events, deps.PollInterval)
+			}()
 		}
 	}
 
 	logger.Printf("Configuration reloaded. Monitoring %d jobs.", len(activeJobs))
 }
 
+// waitForMonitors blocks until every monitor goroutine has exited (or a
+// timeout elapses), draining any final events so none of them hang on a send.
+func waitForMonitors(wg *sync.WaitGroup, events <-chan monitor.JobEvent, logger *log.Logger) {
+	done := make(chan struct{})
+	go func() {
+		wg.Wait()
+		close(done)
+	}()
+
+	timeout := time.NewTimer(5 * time.Second)
+	defer timeout.Stop()
+
+	for {
+		select {
+		case <-done:
+			return
+		case <-events:
+			// Discard events emitted while monitors wind down.
+		case <-timeout.C:
+			logger.Println("Timed out waiting for monitors to stop.")
+			return
+		}
+	}
+}
+
 func runDaemonLoop(deps DaemonDeps, logger *log.Logger) error {
 	if _, err := deps.Store.Load(); err != nil {
 		return fmt.Errorf("failed to load config: %w", err)
 	}
 
-	activeJobs := make(map[string]chan struct{})
+	ctx, cancelAll := context.WithCancel(context.Background())
+	defer cancelAll()
+
+	var wg sync.WaitGroup
+	activeJobs := make(map[string]context.CancelFunc)
 	events := make(chan monitor.JobEvent, 10)
 
-	reloadConfigAndJobs(deps, logger, activeJobs, events)
+	reloadConfigAndJobs(ctx, deps, logger, activeJobs, events, &wg)
+	if len(activeJobs) == 0 {
+		logger.Println("No jobs to monitor. Shutting down daemon.")
+		return nil
+	}
 
 	tickerInterval := deps.TickerInterval
 	if tickerInterval <= 0 {
@@ -185,10 +222,11 @@ func runDaemonLoop(deps DaemonDeps, logger *log.Logger) error {
 		select {
 		case <-deps.Stop:
 			logger.Println("Stop received, stopping all monitors.")
-			for jobURL, stopChan := range activeJobs {
+			for jobURL := range activeJobs {
 				logger.Printf("Stopping monitor for %s", jobURL)
-				close(stopChan)
 			}
+			cancelAll()
+			waitForMonitors(&wg, events, logger)
 			logger.Println("Daemon stopped.")
 			return nil
 
@@ -196,30 +234,33 @@ func runDaemonLoop(deps DaemonDeps, logger *log.Logger) error {
 			switch sig {
 			case syscall.SIGHUP:
 				logger.Println("SIGHUP received, reloading config...")
-				reloadConfigAndJobs(deps, logger, activeJobs, events)
+				reloadConfigAndJobs(ctx, deps, logger, activeJobs, events, &wg)
+				if len(activeJobs) == 0 {
+					logger.Println("No more jobs to monitor. Shutting down daemon.")
+					return nil
+				}
 			case syscall.SIGINT, syscall.SIGTERM:
 				logger.Println("Shutdown signal received, stopping all monitors.")
-				for jobURL, stopChan := range activeJobs {
+				for jobURL := range activeJobs {
 					logger.Printf("Stopping monitor for %s", jobURL)
-					close(stopChan)
 				}
-				time.Sleep(1 * time.Second)
+				cancelAll()
+				waitForMonitors(&wg, events, logger)
 				logger.Println("Daemon stopped.")
 				return nil
 			}
 
 		case event := <-events:
 			handleJobEvent(event, logger, deps.Store, activeJobs, deps.Notifier)
+			if len(activeJobs) == 0 {
+				logger.Println("No more jobs to monitor. Shutting down daemon.")
+				return nil
+			}
 
 		case <-ticker.C:
 			if deps.OnTick != nil {
 				deps.OnTick()
 			}
-
-			if len(activeJobs) == 0 {
-				logger.Println("No more jobs to monitor. Shutting down daemon.")
-				return nil
-			}
 		}
 	}
 }
@@ -6,11 +6,14 @@ import (
 	"os"
 	"os/exec"
 	"os/signal"
+	"strconv"
 	"syscall"
 
 	"github.com/spf13/cobra"
 )
 
+var logLines int
+
 var logsCmd = &cobra.Command{
 	Use:   "logs",
 	Short: "Follow the logs of the jenkins-monitor daemon",
@@ -26,7 +29,10 @@ var logsCmd = &cobra.Command{
 			return
 		}
 
-		tailCmd := exec.Command("tail", "-f", logFile)
+		// tail seeks from the end of the file, so the daemon log is never
+		// read into memory regardless of how large it has grown. -F follows
+		// by name so the session survives the daemon rotating the file.
+		tailCmd := exec.Command("tail", "-n", strconv.Itoa(logLines), "-F", logFile)
 		tailCmd.Stdout = os.Stdout
 		tailCmd.Stderr = os.Stderr
 
@@ -49,4 +55,5 @@ var logsCmd = &cobra.Command{
 
 func init() {
 	RootCmd.AddCommand(logsCmd)
+	logsCmd.Flags().IntVarP(&logLines, "lines", "n", 10, "Number of recent log lines to show before following")
 }
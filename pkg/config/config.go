@@ -133,7 +133,13 @@ func saveToDisk(config *Config) error {
 		return err
 	}
 
-	return os.WriteFile(path, data, 0o644)
+	// Write to a temp file and rename into place so a crash mid-write can
+	// never leave a truncated config behind.
+	tmpPath := path + ".tmp"
+	if err := os.WriteFile(tmpPath, data, 0o644); err != nil {
+		return err
+	}
+	return os.Rename(tmpPath, path)
 }
 
 func (c *Config) AddJob(jobURL string) {
@@ -173,6 +179,17 @@ func (c *Config) HasJob(jobURL string) bool {
 	return exists
 }
 
+// clone returns a deep copy so cached state is never aliased by callers.
+func (c *Config) clone() *Config {
+	dup := &Config{
+		Jobs:         make(map[string]Job, len(c.Jobs)),
+		History:      append([]HistoryEntry(nil), c.History...),
+		UpgradeState: c.UpgradeState,
+	}
+	maps.Copy(dup.Jobs, c.Jobs)
+	return dup
+}
+
 func (c *Config) GetJobs() map[string]Job {
 	// Return a copy to prevent concurrent map access
 	jobs := make(map[string]Job, len(c.Jobs))
@@ -199,3 +199,28 @@ func TestLoad_ReturnsCachedInstance(t *testing.T) {
 	assert.NoError(t, err, "failed to load config: %v", err)
 	assert.False(t, cachedCfg.HasJob(url), "Load() should return a fresh instance reflecting disk")
 }
+
+func TestUpdate_ErrUnchangedSkipsSave(t *testing.T) {
+	dir := t.TempDir()
+	t.Setenv("HOME", dir)
+
+	store := NewDiskStore()
+
+	url := "http://jenkins/job/test"
+	err := store.Update(func(c *Config) error {
+		c.AddJob(url)
+		return nil
+	})
+	assert.NoError(t, err, "failed to seed config: %v", err)
+
+	// Mutations made by a callback that reports ErrUnchanged must not reach disk.
+	err = store.Update(func(c *Config) error {
+		delete(c.Jobs, url)
+		return ErrUnchanged
+	})
+	assert.NoError(t, err, "Update with ErrUnchanged should not error: %v", err)
+
+	reloaded, err := store.Load()
+	assert.NoError(t, err, "failed to reload config: %v", err)
+	assert.True(t, reloaded.HasJob(url), "ErrUnchanged should have skipped the save")
+}
@@ -1,6 +1,15 @@
 package config
 
-import "sync"
+import (
+	"errors"
+	"os"
+	"sync"
+	"time"
+)
+
+// ErrUnchanged can be returned from an Update callback to signal that the
+// config was not modified, letting the store skip the disk write.
+var ErrUnchanged = errors.New("config unchanged")
 
 type ConfigStore interface {
 	Load() (*Config, error)
@@ -9,7 +18,10 @@ type ConfigStore interface {
 }
 
 type DiskStore struct {
-	mu sync.Mutex
+	mu          sync.Mutex
+	cached      *Config
+	cachedMtime time.Time
+	cachedSize  int64
 }
 
 func NewDiskStore() *DiskStore {
@@ -20,7 +32,7 @@ func (s *DiskStore) Load() (*Config, error) {
 	var cfg *Config
 	err := s.withLock(func() error {
 		var loadErr error
-		cfg, loadErr = loadFromDisk()
+		cfg, loadErr = s.loadLocked()
 		return loadErr
 	})
 	if err != nil {
@@ -31,23 +43,76 @@ func (s *DiskStore) Load() (*Config, error) {
 
 func (s *DiskStore) Save(cfg *Config) error {
 	return s.withLock(func() error {
-		return saveToDisk(cfg)
+		return s.saveLocked(cfg)
 	})
 }
 
 func (s *DiskStore) Update(fn func(*Config) error) error {
 	return s.withLock(func() error {
-		cfg, err := loadFromDisk()
+		cfg, err := s.loadLocked()
 		if err != nil {
 			return err
 		}
 		if err := fn(cfg); err != nil {
+			if errors.Is(err, ErrUnchanged) {
+				return nil
+			}
 			return err
 		}
-		return saveToDisk(cfg)
+		return s.saveLocked(cfg)
 	})
 }
 
+// loadLocked returns the current config, re-reading the file only when its
+// mtime differs from the cached copy. Must be called with the lock held.
+func (s *DiskStore) loadLocked() (*Config, error) {
+	path, err := GetConfigPath()
+	if err != nil {
+		return nil, err
+	}
+
+	info, err := os.Stat(path)
+	if err != nil {
+		if os.IsNotExist(err) {
+			s.cached = nil
+			return &Config{Jobs: make(map[string]Job)}, nil
+		}
+		return nil, err
+	}
+
+	if s.cached != nil && info.ModTime().Equal(s.cachedMtime) && info.Size() == s.cachedSize {
+		return s.cached.clone(), nil
+	}
+
+	cfg, err := loadFromDisk()
+	if err != nil {
+		return nil, err
+	}
+	s.cached = cfg.clone()
+	s.cachedMtime = info.ModTime()
+	s.cachedSize = info.Size()
+	return cfg, nil
+}
+
+// saveLocked writes the config and refreshes the cache. Must be called with
+// the lock held.
+func (s *DiskStore) saveLocked(cfg *Config) error {
+	if err := saveToDisk(cfg); err != nil {
+		return err
+	}
+
+	s.cached = cfg.clone()
+	s.cachedMtime = time.Time{}
+	s.cachedSize = 0
+	if path, err := GetConfigPath(); err == nil {
+		if info, err := os.Stat(path); err == nil {
+			s.cachedMtime = info.ModTime()
+			s.cachedSize = info.Size()
+		}
+	}
+	return nil
+}
+
 func (s *DiskStore) withLock(fn func() error) error {
 	s.mu.Lock()
 	defer s.mu.Unlock()
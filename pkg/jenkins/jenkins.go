@@ -5,11 +5,24 @@ import (
 	"fmt"
 	"net/http"
 	"strings"
+	"sync"
 	"time"
 )
 
 const httpTimeout = 30 * time.Second
 
+// httpClient is shared by all status polls so keep-alive connections to the
+// same Jenkins host are reused across polling cycles instead of paying a new
+// TCP+TLS handshake per request.
+var httpClient = &http.Client{
+	Timeout: httpTimeout,
+	Transport: &http.Transport{
+		MaxIdleConns:        64,
+		MaxIdleConnsPerHost: 32,
+		IdleConnTimeout:     90 * time.Second,
+	},
+}
+
 type ContentTypeError struct {
 	ContentType string
 }
@@ -18,31 +31,56 @@ func (e *ContentTypeError) Error() string {
 	return fmt.Sprintf("expected JSON response but got %q (server may require authentication or URL is not a Jenkins job)", e.ContentType)
 }
 
+// cachedStatus pairs the last parsed status for an API URL with the ETag the
+// server sent alongside it, so the next poll can ask for a 304 instead of the
+// full body.
+type cachedStatus struct {
+	etag   string
+	status JobStatus
+}
+
+var (
+	etagMu    sync.Mutex
+	etagCache = make(map[string]cachedStatus)
+)
+
 type JobStatus struct {
 	Building  bool   `json:"building"`
 	Result    string `json:"result"`
 	Timestamp int64  `json:"timestamp"`
 }
 
-// GetJobStatus fetches the status of a Jenkins job, and returns the JobStatus
-// struct, http status code, and error if any.
-func GetJobStatus(jenkinsURL, token string) (*JobStatus, int, error) {
-	apiURL := jenkinsURL + "/api/json?tree=building,result,timestamp"
-
-	req, err := http.NewRequest("GET", apiURL, nil)
+// GetJobStatus fetches the status of a Jenkins job via its precomputed API
+// URL, and returns the JobStatus struct, http status code, and error if any.
+// authHeader is a prebuilt Authorization value (see BasicAuth).
+func GetJobStatus(job Job, authHeader string) (*JobStatus, int, error) {
+	req, err := http.NewRequest("GET", job.APIURL, nil)
 	if err != nil {
 		return nil, 0, err
 	}
 
-	req.Header.Set("Authorization", "Basic "+token)
+	req.Header.Set("Authorization", authHeader)
 
-	client := &http.Client{Timeout: httpTimeout}
-	resp, err := client.Do(req)
+	etagMu.Lock()
+	cached, hasCached := etagCache[job.APIURL]
+	etagMu.Unlock()
+	if hasCached {
+		req.Header.Set("If-None-Match", cached.etag)
+	}
+
+	resp, err := httpClient.Do(req)
 	if err != nil {
 		return nil, 0, err
 	}
 	defer resp.Body.Close()
 
+	// Unchanged since the last poll; reuse the parsed status without
+	// re-reading the body.
+	if resp.StatusCode == http.StatusNotModified && hasCached {
+		status := cached.status
+		return &status, resp.StatusCode, nil
+	}
+
 	if resp.StatusCode == http.StatusNotFound {
 		return nil, resp.StatusCode, fmt.Errorf("job not found (404)")
 	}
@@ -60,5 +98,14 @@ func GetJobStatus(jenkinsURL, token string) (*JobStatus, int, error) {
 	if err := json.NewDecoder(resp.Body).Decode(&status); err != nil {
 		return nil, resp.StatusCode, err
 	}
+
+	etagMu.Lock()
+	if etag := resp.Header.Get("ETag"); etag != "" {
+		etagCache[job.APIURL] = cachedStatus{etag: etag, status: status}
+	} else {
+		delete(etagCache, job.APIURL)
+	}
+	etagMu.Unlock()
+
 	return &status, resp.StatusCode, nil
 }
@@ -68,7 +68,7 @@ func TestGetJobStatus(t *testing.T) {
 				token = ""
 			}
 
-			status, code, err := GetJobStatus(server.URL, token)
+			status, code, err := GetJobStatus(NewJob(server.URL), BasicAuth(token))
 			assert.Equal(t, tt.wantErr, err != nil, "unexpected error")
 			assert.Equal(t, tt.expectStatus, code, "expected status %d, got %d", tt.expectStatus, code)
 			assert.Equal(t, tt.expected.Building, status.Building, "Building mismatch")
@@ -80,3 +80,35 @@ func TestGetJobStatus(t *testing.T) {
 		})
 	}
 }
+
+func TestGetJobStatus_ETagCache(t *testing.T) {
+	expected := JobStatus{Building: true, Result: "", Timestamp: 1234567890}
+	var requestCount int
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requestCount++
+		if r.Header.Get("If-None-Match") == `"abc123"` {
+			w.WriteHeader(http.StatusNotModified)
+			return
+		}
+		w.Header().Set("Content-Type", "application/json")
+		w.Header().Set("ETag", `"abc123"`)
+		_ = json.NewEncoder(w).Encode(expected)
+	}))
+	defer server.Close()
+
+	job := NewJob(server.URL)
+
+	// First poll gets a full body and caches it against the ETag.
+	status, code, err := GetJobStatus(job, BasicAuth("test-token"))
+	assert.NoError(t, err)
+	assert.Equal(t, http.StatusOK, code)
+	assert.Equal(t, expected.Building, status.Building)
+
+	// Second poll sends If-None-Match and is served from the cache on 304.
+	status, code, err = GetJobStatus(job, BasicAuth("test-token"))
+	assert.NoError(t, err)
+	assert.Equal(t, http.StatusNotModified, code)
+	assert.Equal(t, expected.Building, status.Building)
+	assert.Equal(t, expected.Timestamp, status.Timestamp)
+	assert.Equal(t, 2, requestCount, "expected both polls to hit the server")
+}
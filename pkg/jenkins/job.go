@@ -0,0 +1,26 @@
+package jenkins
+
+import "strings"
+
+// Job carries fields derived from a monitored job URL, computed once when
+// monitoring starts instead of being re-split on every poll and log line.
+type Job struct {
+	URL    string
+	Name   string
+	APIURL string
+}
+
+func NewJob(url string) Job {
+	parts := strings.Split(url, "/job/")
+	return Job{
+		URL:    url,
+		Name:   strings.TrimRight(parts[len(parts)-1], "/"),
+		APIURL: strings.TrimRight(url, "/") + "/api/json?tree=building,result,timestamp",
+	}
+}
+
+// BasicAuth builds the Authorization header value for a pre-encoded base64
+// token; callers compute it once rather than concatenating per request.
+func BasicAuth(token string) string {
+	return "Basic " + token
+}
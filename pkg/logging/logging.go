@@ -1,11 +1,17 @@
 package logging
 
 import (
+	"fmt"
 	"log"
 	"os"
 	"path/filepath"
 )
 
+const (
+	maxLogSize  = 1 << 20 // bytes per log file before rotation
+	backupCount = 3       // rotated files kept (.1 newest, .3 oldest)
+)
+
 func GetLogFilePath() (string, error) {
 	home, err := os.UserHomeDir()
 	if err != nil {
@@ -14,6 +20,60 @@ func GetLogFilePath() (string, error) {
 	return filepath.Join(home, ".jw", "jenkins_monitor.log"), nil
 }
 
+// rotatingWriter appends to the log file and rotates it to numbered backups
+// once it exceeds maxLogSize, so a long-running daemon can't grow the log
+// without bound. It is only written to through a log.Logger, which already
+// serializes calls, so no extra locking is needed.
+type rotatingWriter struct {
+	path string
+	file *os.File
+	size int64
+}
+
+func newRotatingWriter(path string) (*rotatingWriter, error) {
+	file, err := os.OpenFile(path, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0o644)
+	if err != nil {
+		return nil, err
+	}
+
+	w := &rotatingWriter{path: path, file: file}
+	if info, err := file.Stat(); err == nil {
+		w.size = info.Size()
+	}
+	return w, nil
+}
+
+func (w *rotatingWriter) Write(p []byte) (int, error) {
+	if w.size+int64(len(p)) > maxLogSize {
+		if err := w.rotate(); err != nil {
+			return 0, err
+		}
+	}
+
+	n, err := w.file.Write(p)
+	w.size += int64(n)
+	return n, err
+}
+
+func (w *rotatingWriter) rotate() error {
+	w.file.Close()
+
+	// Shift existing backups up and move the live file to .1. Missing
+	// backups are fine; the renames just no-op.
+	for i := backupCount - 1; i >= 1; i-- {
+		_ = os.Rename(fmt.Sprintf("%s.%d", w.path, i), fmt.Sprintf("%s.%d", w.path, i+1))
+	}
+	_ = os.Rename(w.path, w.path+".1")
+
+	file, err := os.OpenFile(w.path, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0o644)
+	if err != nil {
+		return err
+	}
+	w.file = file
+	w.size = 0
+	return nil
+}
+
 func SetupLogger() (*log.Logger, error) {
 	path, err := GetLogFilePath()
 	if err != nil {
@@ -24,10 +84,10 @@ func SetupLogger() (*log.Logger, error) {
 		return nil, err
 	}
 
-	file, err := os.OpenFile(path, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0o644)
+	writer, err := newRotatingWriter(path)
 	if err != nil {
 		return nil, err
 	}
 
-	return log.New(file, "", log.LstdFlags), nil
+	return log.New(writer, "", log.LstdFlags), nil
 }
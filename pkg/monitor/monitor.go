@@ -1,16 +1,26 @@
 package monitor
 
 import (
+	"context"
 	"errors"
 	"log"
+	"math/rand/v2"
 	"net"
-	"strings"
 	"time"
 
 	"jenkins-monitor/pkg/jenkins"
 )
 
-const pollingInterval = 30 * time.Second
+const (
+	pollingInterval    = 30 * time.Second
+	maxBackoff         = 5 * time.Minute
+	maxConcurrentPolls = 32
+)
+
+// pollSlots caps how many status requests are in flight at once across all
+// monitors. Goroutines themselves are cheap; the limit exists so a large job
+// list can't fire hundreds of simultaneous requests at one Jenkins host.
+var pollSlots = make(chan struct{}, maxConcurrentPolls)
 
 // EventKind describes what happened during a monitoring check.
 type EventKind int
@@ -36,74 +46,117 @@ type JobEvent struct {
 }
 
 // MonitorJob polls a Jenkins job for its status and emits events on the provided channel.
-func MonitorJob(jobURL, token string, logger *log.Logger, events chan<- JobEvent, pollInterval time.Duration, stop <-chan struct{}) {
+// It runs until the job finishes or ctx is cancelled.
+func MonitorJob(ctx context.Context, jobURL, token string, logger *log.Logger, events chan<- JobEvent, pollInterval time.Duration) {
 	if pollInterval <= 0 {
 		pollInterval = pollingInterval
 	}
 
-	jobName := strings.Split(jobURL, "/job/")
-	jobNameSafe := jobName[len(jobName)-1]
+	job := jenkins.NewJob(jobURL)
+	authHeader := jenkins.BasicAuth(token)
 
-	logger.Printf("Started monitoring: %s", jobNameSafe)
-	defer logger.Printf("Stopped monitoring: %s", jobNameSafe)
+	logger.Printf("Started monitoring: %s", job.Name)
+	defer logger.Printf("Stopped monitoring: %s", job.Name)
 
-	ticker := time.NewTicker(pollInterval)
-	defer ticker.Stop()
+	consecutiveFailures := 0
 
 	// Perform the first check immediately.
-	if checkJobStatus(jobURL, token, jobNameSafe, logger, events) {
+	shouldStop, transient := checkJobStatus(job, authHeader, logger, events)
+	if shouldStop {
 		return
 	}
+	consecutiveFailures = nextFailureCount(consecutiveFailures, transient)
+
+	timer := time.NewTimer(backoffDelay(pollInterval, consecutiveFailures))
+	defer timer.Stop()
 
 	for {
 		select {
-		case <-stop:
+		case <-ctx.Done():
 			return
-		case <-ticker.C:
-			if checkJobStatus(jobURL, token, jobNameSafe, logger, events) {
+		case <-timer.C:
+			shouldStop, transient := checkJobStatus(job, authHeader, logger, events)
+			if shouldStop {
 				return
 			}
+			consecutiveFailures = nextFailureCount(consecutiveFailures, transient)
+			delay := backoffDelay(pollInterval, consecutiveFailures)
+			if consecutiveFailures > 0 {
+				logger.Printf("Backing off %s for %s after %d consecutive failures", delay.Round(time.Second), job.Name, consecutiveFailures)
+			}
+			timer.Reset(delay)
 		}
 	}
 }
 
-// checkJobStatus checks a Jenkins job's status and returns true if monitoring should stop.
-func checkJobStatus(jobURL, token, jobNameSafe string, logger *log.Logger, events chan<- JobEvent) (shouldStop bool) {
-	status, statusCode, err := jenkins.GetJobStatus(jobURL, token)
+func nextFailureCount(current int, transient bool) int {
+	if transient {
+		return current + 1
+	}
+	return 0
+}
+
+// backoffDelay returns the wait before the next poll: the plain interval
+// while healthy, and an exponentially growing, jittered delay after
+// consecutive transient failures so many monitors don't retry in lockstep.
+func backoffDelay(pollInterval time.Duration, failures int) time.Duration {
+	if failures <= 0 {
+		return pollInterval
+	}
+
+	backoff := pollInterval << min(failures-1, 5)
+	if backoff <= 0 || backoff > maxBackoff {
+		backoff = maxBackoff
+	}
+
+	var jitter time.Duration
+	if half := int64(pollInterval / 2); half > 0 {
+		jitter = time.Duration(rand.Int64N(half))
+	}
+	return backoff + jitter
+}
+
+// checkJobStatus checks a Jenkins job's status. It reports whether monitoring
+// should stop and whether the check hit a transient error worth backing off on.
+func checkJobStatus(job jenkins.Job, authHeader string, logger *log.Logger, events chan<- JobEvent) (shouldStop, transientError bool) {
+	pollSlots <- struct{}{}
+	status, statusCode, err := jenkins.GetJobStatus(job, authHeader)
+	<-pollSlots
 	if err != nil {
-		return handleJobStatusError(err, statusCode, jobURL, jobNameSafe, logger, events)
+		shouldStop = handleJobStatusError(err, statusCode, job, logger, events)
+		return shouldStop, !shouldStop
 	}
 
-	logger.Printf("Received status for %s: Building=%v, Result=%s", jobNameSafe, status.Building, status.Result)
+	logger.Printf("Received status for %s: Building=%v, Result=%s", job.Name, status.Building, status.Result)
 
 	if !status.Building {
-		logger.Printf("Build finished: %s - Status: %s", jobNameSafe, status.Result)
+		logger.Printf("Build finished: %s - Status: %s", job.Name, status.Result)
 		events <- JobEvent{
-			JobURL:  jobURL,
-			JobName: jobNameSafe,
+			JobURL:  job.URL,
+			JobName: job.Name,
 			Kind:    EventFinished,
 			Result:  status.Result,
 			Failed:  false,
 		}
-		return true
+		return true, false
 	}
 
 	events <- JobEvent{
-		JobURL:  jobURL,
-		JobName: jobNameSafe,
+		JobURL:  job.URL,
+		JobName: job.Name,
 		Kind:    EventStatusChecked,
 		Failed:  status.Result == "FAILURE",
 	}
-	return false
+	return false, false
 }
 
 // handleJobStatusError handles errors from getting job status and returns true if monitoring should stop.
-func handleJobStatusError(err error, statusCode int, jobURL, jobNameSafe string, logger *log.Logger, events chan<- JobEvent) (shouldStop bool) {
+func handleJobStatusError(err error, statusCode int, job jenkins.Job, logger *log.Logger, events chan<- JobEvent) (shouldStop bool) {
 	if statusCode == 404 {
-		logger.Printf("Job '%s' not found (404). Removing.", jobNameSafe)
+		logger.Printf("Job '%s' not found (404). Removing.", job.Name)
 		events <- JobEvent{
-			JobURL:  jobURL,
-			JobName: jobNameSafe,
+			JobURL:  job.URL,
+			JobName: job.Name,
 			Kind:    EventNotFound,
 			Failed:  true,
 			Error:   err,
@@ -112,10 +165,10 @@ func handleJobStatusError(err error, statusCode int, jobURL, jobNameSafe string,
 	}
 
 	if statusCode == 401 || statusCode == 403 {
-		logger.Printf("Unauthorized for job '%s' (%d). Removing.", jobNameSafe, statusCode)
+		logger.Printf("Unauthorized for job '%s' (%d). Removing.", job.Name, statusCode)
 		events <- JobEvent{
-			JobURL:  jobURL,
-			JobName: jobNameSafe,
+			JobURL:  job.URL,
+			JobName: job.Name,
 			Kind:    EventUnauthorized,
 			Failed:  true,
 			Error:   err,
@@ -124,10 +177,10 @@ func handleJobStatusError(err error, statusCode int, jobURL, jobNameSafe string,
 	}
 
 	if statusCode >= 400 && statusCode < 500 && statusCode != 429 {
-		logger.Printf("Client error for job '%s' (%d). Removing.", jobNameSafe, statusCode)
+		logger.Printf("Client error for job '%s' (%d). Removing.", job.Name, statusCode)
 		events <- JobEvent{
-			JobURL:  jobURL,
-			JobName: jobNameSafe,
+			JobURL:  job.URL,
+			JobName: job.Name,
 			Kind:    EventClientError,
 			Failed:  true,
 			Error:   err,
@@ -138,10 +191,10 @@ func handleJobStatusError(err error, statusCode int, jobURL, jobNameSafe string,
 	// Non-JSON response means the URL is not a Jenkins endpoint — no point retrying.
 	var ctErr *jenkins.ContentTypeError
 	if errors.As(err, &ctErr) {
-		logger.Printf("Non-Jenkins URL for job '%s': %v. Removing.", jobNameSafe, err)
+		logger.Printf("Non-Jenkins URL for job '%s': %v. Removing.", job.Name, err)
 		events <- JobEvent{
-			JobURL:  jobURL,
-			JobName: jobNameSafe,
+			JobURL:  job.URL,
+			JobName: job.Name,
 			Kind:    EventClientError,
 			Failed:  true,
 			Error:   err,
@@ -152,10 +205,10 @@ func handleJobStatusError(err error, statusCode int, jobURL, jobNameSafe string,
 	// DNS resolution failure means the host doesn't exist — no point retrying.
 	var dnsErr *net.DNSError
 	if errors.As(err, &dnsErr) && dnsErr.IsNotFound {
-		logger.Printf("DNS lookup failed for job '%s': %v. Removing.", jobNameSafe, err)
+		logger.Printf("DNS lookup failed for job '%s': %v. Removing.", job.Name, err)
 		events <- JobEvent{
-			JobURL:  jobURL,
-			JobName: jobNameSafe,
+			JobURL:  job.URL,
+			JobName: job.Name,
 			Kind:    EventDNSError,
 			Failed:  true,
 			Error:   err,
@@ -163,10 +216,10 @@ func handleJobStatusError(err error, statusCode int, jobURL, jobNameSafe string,
 		return true
 	}
 
-	logger.Printf("Error getting status for %s: %v. Will retry.", jobNameSafe, err)
+	logger.Printf("Error getting status for %s: %v. Will retry.", job.Name, err)
 	events <- JobEvent{
-		JobURL:  jobURL,
-		JobName: jobNameSafe,
+		JobURL:  job.URL,
+		JobName: job.Name,
 		Kind:    EventError,
 		Failed:  true,
 		Error:   err,
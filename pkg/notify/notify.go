@@ -4,7 +4,6 @@ import (
 	"fmt"
 	"log"
 	"os/exec"
-	"strings"
 	"sync"
 )
 
@@ -13,31 +12,38 @@ type Notifier interface {
 }
 
 type MacNotifier struct {
-	once           sync.Once
-	notifierExists bool
+	once         sync.Once
+	notifierPath string
 }
 
-func (m *MacNotifier) checkNotifier() {
+// resolveNotifier looks up terminal-notifier once and caches its absolute
+// path so each notification execs it directly instead of re-searching PATH.
+func (m *MacNotifier) resolveNotifier() string {
 	m.once.Do(func() {
-		if _, err := exec.LookPath("terminal-notifier"); err != nil {
+		path, err := exec.LookPath("terminal-notifier")
+		if err != nil {
 			log.Println("terminal-notifier not found in PATH")
-			m.notifierExists = false
-		} else {
-			m.notifierExists = true
+			return
 		}
+		m.notifierPath = path
 	})
+	return m.notifierPath
 }
 
 func (m *MacNotifier) Send(title, message, url string) error {
-	m.checkNotifier()
+	notifierPath := m.resolveNotifier()
 
 	var result *exec.Cmd
-	if !m.notifierExists {
-		script := fmt.Sprintf(
-			`display notification (do shell script "echo %s") with title (do shell script "echo %s")`,
-			shellQuote(message), shellQuote(title),
+	if notifierPath == "" {
+		// Pass message and title as script arguments so no shell is ever
+		// involved and their content can't be interpreted as code.
+		result = exec.Command(
+			"osascript",
+			"-e", "on run argv",
+			"-e", "display notification (item 1 of argv) with title (item 2 of argv)",
+			"-e", "end run",
+			message, title,
 		)
-		result = exec.Command("osascript", "-e", script)
 		log.Println("Using osascript fallback (terminal-notifier not found in PATH)")
 	} else {
 		log.Println("Using terminal-notifier")
@@ -50,7 +56,7 @@ func (m *MacNotifier) Send(title, message, url string) error {
 		if url != "" {
 			args = append(args, "-open", url)
 		}
-		result = exec.Command("terminal-notifier", args...)
+		result = exec.Command(notifierPath, args...)
 	}
 
 	output, err := result.CombinedOutput()
@@ -59,7 +65,3 @@ func (m *MacNotifier) Send(title, message, url string) error {
 	}
 	return nil
 }
-
-func shellQuote(s string) string {
-	return "'" + strings.ReplaceAll(s, "'", "'\\''") + "'"
-}
@@ -1,6 +1,7 @@
 package pidfile
 
 import (
+	"errors"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -28,23 +29,21 @@ func IsDaemonRunning() (int, bool) {
 		return 0, false
 	}
 
-	pid, err := strconv.Atoi(string(data))
+	pid, err := strconv.Atoi(strings.TrimSpace(string(data)))
 	if err != nil {
 		return 0, false
 	}
 
-	process, err := os.FindProcess(pid)
-	if err != nil {
-		return 0, false
-	}
-
-	err = process.Signal(syscall.Signal(0))
+	// Signal 0 probes the process without touching it. syscall.Kill is used
+	// directly: os.FindProcess never fails on Unix, and its Signal method
+	// wraps the errno in a way the old type assertion could panic on.
+	err = syscall.Kill(pid, 0)
 	if err == nil {
 		return pid, true
 	}
 
 	// If the error is ESRCH, the process doesn't exist.
-	if err.(syscall.Errno) == syscall.ESRCH {
+	if errors.Is(err, syscall.ESRCH) {
 		// Clean up stale PID file
 		os.Remove(path)
 		return 0, false